@@ -3,6 +3,9 @@
 
 Automated benchmarking with timing for each function category.
 
+Usage:
+    python tests/benchmark.py [--n N] [--only CATEGORIES] [--skip CATEGORIES] [--jobs JOBS]
+
 Notable differences between rust-chess and python-chess:
     - rust-chess does not currently support popping since there is no board history.
 
@@ -41,27 +44,281 @@ Null Move         |  0.010831 |    0.170929 |   15.782040
 Total             |  1.098110 |   37.115544 |   33.799470
 """
 
-import time
+import argparse
+import ast
+import gc
+import inspect
+import multiprocessing
+import os
+import statistics
+import sys
+import textwrap
+import timeit
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 
 import chess
 import chess.polyglot
 
 import rust_chess as rc
 
+FEN = "rnbqkbnr/ppp1pppp/8/3p4/2P1P3/8/PP1P1PPP/RNBQKBNR b KQkq - 0 2"
+FEN_2 = "rnbqkbnr/ppp1p1pp/5p2/3p4/4P3/3P4/PPP1KPPP/RNBQ1BNR b kq - 1 3"
+UCI_E2E3 = "e2e3"
+UCI_E2E4 = "e2e4"
+UCI_G1F3 = "g1f3"
+
+# Boards shared by the setups, so each FEN is only parsed once
+# Benches that change a shared board must restore it every call (e.g. reset_move_generator() for rust-chess)
+RC_BOARD = rc.Board()
+RC_BOARD_FEN = rc.Board(FEN)
+RC_BOARD_FEN2 = rc.Board(FEN_2)
+PY_BOARD = chess.Board()
+PY_BOARD_FEN = chess.Board(FEN)
+PY_BOARD_FEN2 = chess.Board(FEN_2)
+
+# Consume an iterator in C without storing its items (extending an empty bounded deque)
+drain = deque(maxlen=0).extend
+
+REPEAT = 5  # Number of timed runs per category (the fastest is reported)
+
+# Python times from the results above, used to start the slowest categories first
+EXPECTED_TIMES = {
+    "Colors": 0.005583,
+    "Pieces": 0.010251,
+    "Squares": 0.044927,
+    "Moves": 0.217583,
+    "Board Init": 5.094908,
+    "Board Props": 6.110863,
+    "Board Ops": 0.468387,
+    "Board Ops 2": 0.126599,
+    "Make Move": 0.607373,
+    "Make Move (New)": 0.492972,
+    "Undo Move": 0.528625,
+    "Next Move": 0.375795,
+    "Generate Moves": 5.230344,
+    "SAN Parse": 0.571996,
+    "King Square": 0.020101,
+    "Zobrist Hash": 1.781595,
+    "Checkmate": 0.098640,
+    "Insufficient Mat.": 0.054583,
+    "Bitboard Ops": 0.076017,
+    "Board Bitboards": 0.024426,
+    "Castle Rights": 0.248873,
+    "Repetitions": 14.161510,
+    "Board Status": 0.544159,
+    "Square/Piece Adv.": 0.048505,
+    "Null Move": 0.170929,
+}
+
+# Cheap categories where the call overhead would dominate, so their bodies are inlined into the timing loop
+INLINED_BENCHMARKS = {"Colors", "Pieces", "Squares", "Bitboard Ops"}
+
+
+def inline_source(bench):
+    # Get the parameter names and body source of a bench function
+    func = ast.parse(textwrap.dedent(inspect.getsource(bench))).body[0]
+    params = [arg.arg for arg in func.args.args]
+    body = "\n".join(ast.unparse(stmt) for stmt in func.body)
+    return params, body
+
+
+def time_bench(setup, bench, n, *, inline=False):
+    # Build the objects once so only the operation itself is timed
+    objs = setup()
+    if inline:
+        # Paste the body into timeit's loop so there is no function call per iteration
+        params, body = inline_source(bench)
+        timer = timeit.Timer(
+            stmt=body,
+            setup=f"{', '.join(params)}, = _objs" if params else "pass",  # Bind the arguments as locals
+            globals={**bench.__globals__, "_objs": objs},
+        )
+    else:
+        # Pre-bind the arguments (partial is called from C, so no argument unpacking per iteration)
+        timer = timeit.Timer(partial(bench, *objs))
+    # Warm up first so one-time costs (lazy imports, type lookups, interpreter inline caches) are not timed
+    timer.timeit(number=min(1000, n // 100))
+    # Start from a clean heap (timeit already disables the GC during each timed run)
+    gc.collect()
+    return timer.repeat(repeat=REPEAT, number=n)
+
+
+def benchmark(name, rust_setup, rust_bench, python_setup, python_bench, n=100_000):  # noqa: PLR0913, PLR0917
+    inline = name in INLINED_BENCHMARKS
+
+    # Raise the thread switch interval so background threads can't force GIL handoffs mid-measurement
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1.0)
+    try:
+        rust_times = time_bench(rust_setup, rust_bench, n, inline=inline)
+        python_times = time_bench(python_setup, python_bench, n, inline=inline)
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+    return rust_times, python_times
+
+
+def summarize(times):
+    # Best run (least system noise), median (typical run), and 95th percentile (to spot noisy categories)
+    return min(times), statistics.median(times), statistics.quantiles(times, n=20, method="inclusive")[-1]
+
+
+def get_speedup(rust_time, python_time):
+    return python_time / rust_time if rust_time > 0 else float("inf")
+
+
+def pin_worker(cpu_queue):
+    # Pin each worker process to its own core to avoid migration noise (Linux only)
+    if hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, {cpu_queue.get()})
+
+
+# Setup functions (run once per category, outside of the timed loop)
+
+
+def rust_no_setup():
+    return ()
+
 
-def benchmark(_name, rust_func, python_func, rust_args=(), python_args=(), n=100_000):
-    start = time.perf_counter()
-    for _ in range(n):
-        rust_func(*rust_args)
-    rust_time = time.perf_counter() - start
+def python_no_setup():
+    return ()
+
+
+def rust_board_setup():
+    return (RC_BOARD,)
+
+
+def python_board_setup():
+    return (PY_BOARD,)
+
+
+def rust_board_move_setup():
+    return RC_BOARD, rc.Move(rc.Square(12), rc.Square(28))
+
+
+def python_board_move_setup():
+    return PY_BOARD, chess.Move(chess.Square(12), chess.Square(28))
+
+
+def rust_board_fen_setup():
+    return (RC_BOARD_FEN,)
+
+
+def python_board_fen_setup():
+    return (PY_BOARD_FEN,)
+
+
+def rust_board_fen2_move2_setup():
+    return RC_BOARD_FEN2, rc.Move.from_uci(UCI_E2E3)
+
+
+def python_board_fen2_move2_setup():
+    return PY_BOARD_FEN2, chess.Move.from_uci(UCI_E2E3)
+
+
+def rust_squares_setup():
+    square2 = rc.Square("E2")
+    return (
+        square2,
+        square2.get_name,
+        square2.get_index,
+        square2.get_file,
+        square2.get_rank,
+        square2.up,
+        square2.down,
+        square2.left,
+        square2.right,
+    )
+
+
+def python_squares_setup():
+    square2 = chess.parse_square("e2")
+    return square2, chess.square_name, chess.square_file, chess.square_rank, chess.square_mirror
 
-    start = time.perf_counter()
-    for _ in range(n):
-        python_func(*python_args)
-    python_time = time.perf_counter() - start
 
-    speedup = python_time / rust_time if rust_time > 0 else float("inf")
-    return rust_time, python_time, speedup
+def rust_board_props_setup():
+    board2 = RC_BOARD_FEN2
+    return board2, board2.get_fen, board2.is_fifty_moves, board2.is_check
+
+
+def python_board_props_setup():
+    board2 = PY_BOARD_FEN2
+    return board2, board2.fen, board2.is_fifty_moves, board2.is_check
+
+
+def rust_board_ops_setup():
+    board, move = rust_board_move_setup()
+    return move, board.is_legal_move, board.is_zeroing, board.get_piece_type_on, board.get_color_on, board.get_piece_on
+
+
+def python_board_ops_setup():
+    board, move = python_board_move_setup()
+    return move, board.is_legal, board.is_zeroing, board.piece_type_at, board.color_at, board.piece_at
+
+
+def rust_board_bitboards_setup():
+    board = RC_BOARD
+    return (
+        board.get_pinned_bitboard,
+        board.get_checkers_bitboard,
+        board.get_color_bitboard,
+        board.get_piece_type_bitboard,
+        board.get_piece_bitboard,
+        board.get_all_bitboard,
+    )
+
+
+def python_board_bitboards_setup():
+    board = PY_BOARD
+    return board, board.checkers_mask, board.pieces_mask
+
+
+def rust_castle_rights_setup():
+    board = RC_BOARD
+    return (
+        board.can_castle,
+        board.can_castle_queenside,
+        board.can_castle_kingside,
+        board.get_castle_rights,
+        board.get_my_castle_rights,
+        board.get_their_castle_rights,
+    )
+
+
+def python_castle_rights_setup():
+    board = PY_BOARD
+    return (
+        board,
+        board.has_castling_rights,
+        board.has_queenside_castling_rights,
+        board.has_kingside_castling_rights,
+    )
+
+
+def rust_moves_setup():
+    return (rc.Move.from_uci(UCI_E2E4),)
+
+
+def python_moves_setup():
+    return (chess.Move.from_uci(UCI_E2E4),)
+
+
+def rust_make_move_setup():
+    return (rc.Move.from_uci(UCI_G1F3),)
+
+
+def python_make_move_setup():
+    return (chess.Move.from_uci(UCI_G1F3),)
+
+
+def python_null_move_setup():
+    return PY_BOARD, chess.Move.null()
+
+
+# Benchmark functions (only the measured operations)
+# Squares, moves, and boards are built in the setups; only Board Init (and Make Move's fresh board) time construction
 
 
 def rust_colors():
@@ -88,36 +345,30 @@ def python_pieces():
     str(pawn)
 
 
-def rust_squares():
-    square = rc.Square(12)
-    square2 = rc.Square("E2")
+def rust_squares(square2, get_name, get_index, get_file, get_rank, up, down, left, right):  # noqa: PLR0913, PLR0917
     square3 = rc.A3
     str(square2)
-    square2.get_name()
-    square2.get_index()
-    square2.get_file()
-    square2.get_rank()
-    square2.up()
-    square2.down()
-    square2.left()
-    square2.right()
-
-
-def python_squares():
-    square = chess.Square(12)
-    square2 = chess.parse_square("e2")
+    get_name()
+    get_index()
+    get_file()
+    get_rank()
+    up()
+    down()
+    left()
+    right()
+
+
+def python_squares(square2, square_name, square_file, square_rank, square_mirror):
     square3 = chess.A3
     str(square2)
-    chess.square_name(square2)
+    square_name(square2)
     square2
-    chess.square_file(square2)
-    chess.square_rank(square2)
-    chess.square_mirror(square2)
+    square_file(square2)
+    square_rank(square2)
+    square_mirror(square2)
 
 
-def rust_moves():
-    move = rc.Move(rc.Square(12), rc.Square(28))
-    move2 = rc.Move.from_uci("E2e4")
+def rust_moves(move2):
     str(move2)
     move2.get_uci()
     move2.source
@@ -125,9 +376,7 @@ def rust_moves():
     move2.promotion
 
 
-def python_moves():
-    move = chess.Move(chess.Square(12), chess.Square(28))
-    move2 = chess.Move.from_uci("e2e4")
+def python_moves(move2):
     str(move2)
     move2.uci()
     move2.from_square
@@ -137,48 +386,48 @@ def python_moves():
 
 def rust_board_init():
     board = rc.Board()
-    board2 = rc.Board("rnbqkbnr/ppp1p1pp/5p2/3p4/4P3/3P4/PPP1KPPP/RNBQ1BNR b kq - 1 3")
+    board2 = rc.Board(FEN_2)
 
 
 def python_board_init():
     board = chess.Board()
-    board2 = chess.Board("rnbqkbnr/ppp1p1pp/5p2/3p4/4P3/3P4/PPP1KPPP/RNBQ1BNR b kq - 1 3")
+    board2 = chess.Board(FEN_2)
 
 
-def rust_board_props(board2):
+def rust_board_props(board2, get_fen, is_fifty_moves, is_check):
     str(board2)
-    board2.get_fen()
+    get_fen()
     board2.halfmove_clock
     board2.fullmove_number
     board2.turn
-    board2.is_fifty_moves()
-    board2.is_check()
+    is_fifty_moves()
+    is_check()
 
 
-def python_board_props(board2):
+def python_board_props(board2, fen, is_fifty_moves, is_check):
     str(board2)
-    board2.fen()
+    fen()
     board2.halfmove_clock
     board2.fullmove_number
     board2.turn
-    board2.is_fifty_moves()
-    board2.is_check()
+    is_fifty_moves()
+    is_check()
 
 
-def rust_board_ops(board, move):
-    board.is_legal_move(move)
-    board.is_zeroing(move)
-    board.get_piece_type_on(rc.E2)
-    board.get_color_on(rc.E2)
-    board.get_piece_on(rc.E4)
+def rust_board_ops(move, is_legal_move, is_zeroing, get_piece_type_on, get_color_on, get_piece_on):  # noqa: PLR0913, PLR0917
+    is_legal_move(move)
+    is_zeroing(move)
+    get_piece_type_on(rc.E2)
+    get_color_on(rc.E2)
+    get_piece_on(rc.E4)
 
 
-def python_board_ops(board, move):
-    board.is_legal(move)
-    board.is_zeroing(move)
-    board.piece_type_at(chess.E2)
-    board.color_at(chess.E2)
-    board.piece_at(chess.E4)
+def python_board_ops(move, is_legal, is_zeroing, piece_type_at, color_at, piece_at):  # noqa: PLR0913, PLR0917
+    is_legal(move)
+    is_zeroing(move)
+    piece_type_at(chess.E2)
+    color_at(chess.E2)
+    piece_at(chess.E4)
 
 
 def rust_board_ops2(board2, move2):
@@ -193,15 +442,13 @@ def python_board_ops2(board2, move2):
     board2.piece_at(chess.E2)
 
 
-def rust_make_move():
-    board = rc.Board()
-    move = rc.Move.from_uci("g1f3")
+def rust_make_move(move):
+    board = rc.Board()  # Fresh starting board (no FEN parsing) since make_move mutates
     board.make_move(move, check_legality=True)
 
 
-def python_make_move():
-    board = chess.Board()
-    move = chess.Move.from_uci("g1f3")
+def python_make_move(move):
+    board = chess.Board()  # Fresh starting board (no FEN parsing) since push mutates
     board.push(move)
 
 
@@ -213,15 +460,11 @@ def python_make_move_new(board, move):
     board.copy().push(move)
 
 
-def rust_undo_move():
-    board = rc.Board()
-    move = rc.Move(rc.Square(12), rc.Square(28))
+def rust_undo_move(board, move):
     board.make_move_new(move)  # Apply and discard (no undo needed)
 
 
-def python_undo_move():
-    board = chess.Board()
-    move = chess.Move(chess.Square(12), chess.Square(28))
+def python_undo_move(board, move):
     board.push(move)
     board.pop()
 
@@ -236,13 +479,17 @@ def python_next_move(board):
 
 
 def rust_generate(board):
-    list(board.generate_legal_captures())
-    list(board.generate_legal_moves())
+    # The board keeps one move generator that draining exhausts (and the board is shared across calls),
+    # so reset it before each drain to generate the same moves as python-chess
+    board.reset_move_generator()
+    drain(board.generate_legal_captures())
+    board.reset_move_generator()
+    drain(board.generate_legal_moves())
 
 
 def python_generate(board):
-    list(board.generate_legal_captures())
-    list(board.generate_legal_moves())
+    drain(board.generate_legal_captures())
+    drain(board.generate_legal_moves())
 
 
 def rust_san_parse(board):
@@ -305,35 +552,49 @@ def python_bitboard_ops():
     bb3 >> 8
 
 
-def rust_board_bitboards(board):
-    board.get_pinned_bitboard()
-    board.get_checkers_bitboard()
-    board.get_color_bitboard(rc.WHITE)
-    board.get_piece_type_bitboard(rc.PAWN)
-    board.get_piece_bitboard(rc.WHITE_PAWN)
-    board.get_all_bitboard()
-
-
-def python_board_bitboards(board):
-    board.checkers_mask
+def rust_board_bitboards(  # noqa: PLR0913, PLR0917
+    get_pinned_bitboard,
+    get_checkers_bitboard,
+    get_color_bitboard,
+    get_piece_type_bitboard,
+    get_piece_bitboard,
+    get_all_bitboard,
+):
+    get_pinned_bitboard()
+    get_checkers_bitboard()
+    get_color_bitboard(rc.WHITE)
+    get_piece_type_bitboard(rc.PAWN)
+    get_piece_bitboard(rc.WHITE_PAWN)
+    get_all_bitboard()
+
+
+def python_board_bitboards(board, checkers_mask, pieces_mask):
+    checkers_mask()
     board.occupied_co[chess.WHITE]
-    board.pieces_mask(chess.PAWN, chess.WHITE)
+    pieces_mask(chess.PAWN, chess.WHITE)
     board.occupied
 
 
-def rust_castle_rights(board):
-    board.can_castle(rc.WHITE)
-    board.can_castle_queenside(rc.WHITE)
-    board.can_castle_kingside(rc.WHITE)
-    board.get_castle_rights(rc.BLACK)
-    board.get_my_castle_rights()
-    board.get_their_castle_rights()
-
-
-def python_castle_rights(board):
-    board.has_castling_rights(chess.WHITE)
-    board.has_queenside_castling_rights(chess.WHITE)
-    board.has_kingside_castling_rights(chess.WHITE)
+def rust_castle_rights(  # noqa: PLR0913, PLR0917
+    can_castle,
+    can_castle_queenside,
+    can_castle_kingside,
+    get_castle_rights,
+    get_my_castle_rights,
+    get_their_castle_rights,
+):
+    can_castle(rc.WHITE)
+    can_castle_queenside(rc.WHITE)
+    can_castle_kingside(rc.WHITE)
+    get_castle_rights(rc.BLACK)
+    get_my_castle_rights()
+    get_their_castle_rights()
+
+
+def python_castle_rights(board, has_castling_rights, has_queenside_castling_rights, has_kingside_castling_rights):
+    has_castling_rights(chess.WHITE)
+    has_queenside_castling_rights(chess.WHITE)
+    has_kingside_castling_rights(chess.WHITE)
     board.castling_rights
 
 
@@ -378,70 +639,122 @@ def rust_null_move(board):
     board.make_null_move_new()
 
 
-def python_null_move(board):
-    board.push(chess.Move.null())
+def python_null_move(board, null_move):
+    board.copy().push(null_move)  # Push on a copy (like make_null_move_new) so the board doesn't grow every iteration
 
 
 if __name__ == "__main__":
-    n = 100_000
-    fen = "rnbqkbnr/ppp1pppp/8/3p4/2P1P3/8/PP1P1PPP/RNBQKBNR b KQkq - 0 2"
-    fen_2 = "rnbqkbnr/ppp1p1pp/5p2/3p4/4P3/3P4/PPP1KPPP/RNBQ1BNR b kq - 1 3"
-
-    rc_board = rc.Board()
-    rc_board_fen = rc.Board(fen)
-    rc_board_fen2 = rc.Board(fen_2)
-    rc_move = rc.Move(rc.Square(12), rc.Square(28))
-    rc_move2 = rc.Move.from_uci("e2e3")
-
-    py_board = chess.Board()
-    py_board_fen = chess.Board(fen)
-    py_board_fen2 = chess.Board(fen_2)
-    py_move = chess.Move(chess.Square(12), chess.Square(28))
-    py_move2 = chess.Move.from_uci("e2e3")
+    parser = argparse.ArgumentParser(description="Benchmark rust-chess against python-chess.")
+    parser.add_argument("--n", type=int, default=100_000, help="iterations per timed run (default: 100,000)")
+    parser.add_argument("--only", default="", help="comma-separated categories to run (default: all)")
+    parser.add_argument("--skip", default="", help="comma-separated categories to skip")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="categories to run in parallel, each in a pinned worker process (default: 1). "
+        "Parallel runs are faster overall, but shared caches and lower clock speeds under load skew per-category "
+        "timings, so they are not comparable with sequential results",
+    )
+    args = parser.parse_args()
+    n = args.n
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
 
     benchmarks = [
-        ("Colors", rust_colors, python_colors, (), ()),
-        ("Pieces", rust_pieces, python_pieces, (), ()),
-        ("Squares", rust_squares, python_squares, (), ()),
-        ("Moves", rust_moves, python_moves, (), ()),
-        ("Board Init", rust_board_init, python_board_init, (), ()),
-        ("Board Props", rust_board_props, python_board_props, (rc_board_fen2,), (py_board_fen2,)),
-        ("Board Ops", rust_board_ops, python_board_ops, (rc_board, rc_move), (py_board, py_move)),
-        ("Board Ops 2", rust_board_ops2, python_board_ops2, (rc_board_fen2, rc_move2), (py_board_fen2, py_move2)),
-        ("Make Move", rust_make_move, python_make_move, (), ()),
-        ("Make Move (New)", rust_make_move_new, python_make_move_new, (rc_board, rc_move), (py_board, py_move)),
-        ("Undo Move", rust_undo_move, python_undo_move, (), ()),
-        ("Next Move", rust_next_move, python_next_move, (rc_board,), (py_board,)),
-        ("Generate Moves", rust_generate, python_generate, (rc_board_fen,), (py_board_fen,)),
-        ("SAN Parse", rust_san_parse, python_san_parse, (rc_board,), (py_board,)),
-        ("King Square", rust_king_square, python_king_square, (rc_board,), (py_board,)),
-        ("Zobrist Hash", rust_zobrist, python_zobrist, (rc_board,), (py_board,)),
-        ("Checkmate", rust_checkmate, python_checkmate, (rc_board,), (py_board,)),
-        ("Insufficient Mat.", rust_insuff_mat, python_insuff_mat, (rc_board,), (py_board,)),
-        ("Bitboard Ops", rust_bitboard_ops, python_bitboard_ops, (), ()),
-        ("Board Bitboards", rust_board_bitboards, python_board_bitboards, (rc_board,), (py_board,)),
-        ("Castle Rights", rust_castle_rights, python_castle_rights, (rc_board,), (py_board,)),
-        ("Repetitions", rust_repetitions, python_repetitions, (rc_board,), (py_board,)),
-        ("Board Status", rust_board_status, python_board_status, (rc_board,), (py_board,)),
-        ("Square/Piece Adv.", rust_square_piece_advanced, python_square_piece_advanced, (), ()),
-        ("Null Move", rust_null_move, python_null_move, (rc_board,), (py_board,)),
+        ("Colors", rust_no_setup, rust_colors, python_no_setup, python_colors),
+        ("Pieces", rust_no_setup, rust_pieces, python_no_setup, python_pieces),
+        ("Squares", rust_squares_setup, rust_squares, python_squares_setup, python_squares),
+        ("Moves", rust_moves_setup, rust_moves, python_moves_setup, python_moves),
+        ("Board Init", rust_no_setup, rust_board_init, python_no_setup, python_board_init),
+        ("Board Props", rust_board_props_setup, rust_board_props, python_board_props_setup, python_board_props),
+        ("Board Ops", rust_board_ops_setup, rust_board_ops, python_board_ops_setup, python_board_ops),
+        ("Board Ops 2", rust_board_fen2_move2_setup, rust_board_ops2, python_board_fen2_move2_setup, python_board_ops2),
+        ("Make Move", rust_make_move_setup, rust_make_move, python_make_move_setup, python_make_move),
+        ("Make Move (New)", rust_board_move_setup, rust_make_move_new, python_board_move_setup, python_make_move_new),
+        ("Undo Move", rust_board_move_setup, rust_undo_move, python_board_move_setup, python_undo_move),
+        ("Next Move", rust_board_setup, rust_next_move, python_board_setup, python_next_move),
+        ("Generate Moves", rust_board_fen_setup, rust_generate, python_board_fen_setup, python_generate),
+        ("SAN Parse", rust_board_setup, rust_san_parse, python_board_setup, python_san_parse),
+        ("King Square", rust_board_setup, rust_king_square, python_board_setup, python_king_square),
+        ("Zobrist Hash", rust_board_setup, rust_zobrist, python_board_setup, python_zobrist),
+        ("Checkmate", rust_board_setup, rust_checkmate, python_board_setup, python_checkmate),
+        ("Insufficient Mat.", rust_board_setup, rust_insuff_mat, python_board_setup, python_insuff_mat),
+        ("Bitboard Ops", rust_no_setup, rust_bitboard_ops, python_no_setup, python_bitboard_ops),
+        (
+            "Board Bitboards",
+            rust_board_bitboards_setup,
+            rust_board_bitboards,
+            python_board_bitboards_setup,
+            python_board_bitboards,
+        ),
+        (
+            "Castle Rights",
+            rust_castle_rights_setup,
+            rust_castle_rights,
+            python_castle_rights_setup,
+            python_castle_rights,
+        ),
+        ("Repetitions", rust_board_setup, rust_repetitions, python_board_setup, python_repetitions),
+        ("Board Status", rust_board_setup, rust_board_status, python_board_setup, python_board_status),
+        ("Square/Piece Adv.", rust_no_setup, rust_square_piece_advanced, python_no_setup, python_square_piece_advanced),
+        ("Null Move", rust_board_setup, rust_null_move, python_null_move_setup, python_null_move),
     ]
 
-    print("Benchmark Results (n=100,000)")
-    print("=" * 60)
-    print(f"{'Category':<17} | {'Rust Time':>9} | {'Python Time':>11} | {'Speedup':>11}")
-    print("-" * 60)
-
-    times = []
-    for name, rust_func, python_func, r_args, p_args in benchmarks:
-        rust_time, python_time, speedup = benchmark(name, rust_func, python_func, r_args, p_args, n)
-        times.append((rust_time, python_time, speedup))
-        print(f"{name:<17} | {rust_time:>9f} | {python_time:>11f} | {speedup:>11f}")
-
-    print("-" * 60)
-    total_rust = sum(r for r, p, s in times)
-    total_python = sum(p for r, p, s in times)
-    total_speedup = total_python / total_rust if total_rust > 0 else float("inf")
-    print(f"{'Total':<17} | {total_rust:>9f} | {total_python:>11f} | {total_speedup:>11f}")
+    only = {name.strip() for name in args.only.split(",") if name.strip()}
+    skip = {name.strip() for name in args.skip.split(",") if name.strip()}
+    unknown = (only | skip) - {name for name, *_ in benchmarks}
+    if unknown:
+        parser.error(f"unknown categories: {', '.join(sorted(unknown))}")
+    benchmarks = [entry for entry in benchmarks if (not only or entry[0] in only) and entry[0] not in skip]
+
+    # Keep profiler output self-describing
+    print(f"# ran n={n}, categories={','.join(name for name, *_ in benchmarks)}")
+
+    print(f"Benchmark Results (n={n:,}, best of {REPEAT})")
+    print("=" * 109)
+    print(
+        f"{'Category':<17} | {'Rust Time':>9} | {'Rust Med':>9} | {'Rust p95':>9} | "
+        f"{'Python Time':>11} | {'Python Med':>11} | {'Python p95':>11} | {'Speedup':>11}",
+    )
+    print("-" * 109)
+
+    if args.jobs == 1:
+        # Sequential in this process, matching how the results above were measured
+        # Lazy, so each row is printed as soon as its category finishes
+        times = (benchmark(*entry, n) for entry in benchmarks)
+    else:
+        # Categories share no state, so each one can run in its own worker process pinned to its own CPU
+        cpus = sorted(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else range(os.cpu_count() or 1)
+        cpus = cpus[: args.jobs]
+        cpu_queue = multiprocessing.Queue()
+        for cpu in cpus:
+            cpu_queue.put(cpu)
+
+        with ProcessPoolExecutor(max_workers=len(cpus), initializer=pin_worker, initargs=(cpu_queue,)) as executor:
+            # Submit the slowest categories first so the workers finish at about the same time
+            order = sorted(range(len(benchmarks)), key=lambda i: -EXPECTED_TIMES.get(benchmarks[i][0], 0.0))
+            futures = {i: executor.submit(benchmark, *benchmarks[i], n) for i in order}
+            times = [futures[i].result() for i in range(len(benchmarks))]
+
+    total_rust = total_python = 0.0
+    for (name, *_), (rust_times, python_times) in zip(benchmarks, times, strict=True):
+        rust_time, rust_median, rust_p95 = summarize(rust_times)
+        python_time, python_median, python_p95 = summarize(python_times)
+        total_rust += rust_time
+        total_python += python_time
+        speedup = get_speedup(rust_time, python_time)
+        print(
+            f"{name:<17} | {rust_time:>9f} | {rust_median:>9f} | {rust_p95:>9f} | "
+            f"{python_time:>11f} | {python_median:>11f} | {python_p95:>11f} | {speedup:>11f}",
+            flush=True,
+        )
+
+    print("-" * 109)
+    total_speedup = get_speedup(total_rust, total_python)
+    print(
+        f"{'Total':<17} | {total_rust:>9f} | {'':>9} | {'':>9} | "
+        f"{total_python:>11f} | {'':>11} | {'':>11} | {total_speedup:>11f}",
+    )
 
     print()
@@ -4,7 +4,7 @@ Notable differences between rust-chess and python-chess:
     - rust-chess does not currently support popping since there is no board history.
 
 Tests the same features from both for fair comparison.
-The tests were run with n = 100,000 and profiled using py-spy (used the VSCode extension to get times in the gutter).
+The tests were run with n = 100,000 (`--repeat 100000`) and profiled using py-spy (used the VSCode extension to get times in the gutter).
 The time delta (rust-chess time - python-chess time) is annotated next to the respective functions.
 
 Conclusions from rust-chess 0.2.0:
@@ -21,6 +21,13 @@ Conclusions from rust-chess 0.2.0:
         - Generating legal moves (substantial)
 """  # noqa: E501
 
+import argparse
+import io
+import os
+import sys
+from contextlib import redirect_stdout
+from timeit import default_timer
+
 import chess
 
 import rust_chess as rc
@@ -30,165 +37,194 @@ import rust_chess as rc
 
 def test_rust_chess() -> None:  # noqa: PLR0915
     """Test the rust-chess library."""
+    out = io.StringIO()  # Buffer the output and write it once at the end (avoids a flush per print)
+
     color = rc.WHITE  # +0.03s
     color2 = rc.COLORS[1]  # +0.04s
-    print(color)  # +0.18s
-    print(color2)  # +0.04s
-    print(not color2)  # +0.03s
-    print()
+    print(color, file=out)  # +0.18s
+    print(color2, file=out)  # +0.04s
+    print(not color2, file=out)  # +0.03s
+    print(file=out)
 
     pawn = rc.PAWN  # Same
-    print(pawn)  # +0.11s
-    print(pawn.get_string())  # Takes 0.72s
-    print(pawn.get_index())  # Takes 1.05s
-    print()
+    print(pawn, file=out)  # +0.11s
+    print(pawn.get_string(), file=out)  # Takes 0.72s
+    print(pawn.get_index(), file=out)  # Takes 1.05s
+    print(file=out)
 
     square = rc.Square(12)  # +0.11s  # noqa: F841
     square2 = rc.Square("E2")  # +0.33s
     square3 = rc.A3  # -0.01s  # noqa: F841
-    print(square2)  # -0.02s
-    print(square2.get_name())  # +0.19s
-    print(square2.get_index())  # Takes 0.86s
-    print(square2.get_file())  # +0.11s
-    print(square2.get_rank())  # +0.22s
-    print(square2.up())  # Takes 0.89s
-    print(square2.down())  # Takes 0.95s
-    print(square2.left())  # Takes 0.90s
-    print(square2.right())  # Takes 0.71s
-    print()
+    print(square2, file=out)  # -0.02s
+    print(square2.get_name(), file=out)  # +0.19s
+    print(square2.get_index(), file=out)  # Takes 0.86s
+    print(square2.get_file(), file=out)  # +0.11s
+    print(square2.get_rank(), file=out)  # +0.22s
+    print(square2.up(), file=out)  # Takes 0.89s
+    print(square2.down(), file=out)  # Takes 0.95s
+    print(square2.left(), file=out)  # Takes 0.90s
+    print(square2.right(), file=out)  # Takes 0.71s
+    print(file=out)
 
     move = rc.Move(rc.Square(12), rc.Square(28))  # -0.12s
     move2 = rc.Move.from_uci("E2e4")  # -1.12s
-    print(move2)  # -0.16s
-    print(move2.get_uci())  # -0.06s
-    print(move2.source)  # +0.10s
-    print(move2.dest)  # +0.25s
-    print(move2.promotion)  # +0.21s
-    print()
+    print(move2, file=out)  # -0.16s
+    print(move2.get_uci(), file=out)  # -0.06s
+    print(move2.source, file=out)  # +0.10s
+    print(move2.dest, file=out)  # +0.25s
+    print(move2.promotion, file=out)  # +0.21s
+    print(file=out)
 
     board = rc.Board()  # -0.54s
     board2 = rc.Board("rnbqkbnr/ppp1p1pp/5p2/3p4/4P3/3P4/PPP1KPPP/RNBQ1BNR b kq - 1 3")  # -23.32s
-    print(board2)  # -10.60s (Not completely comparable (FEN vs grid))
-    print(board2.get_fen())  # -14.78s
-    print(board2.halfmove_clock)  # +0.27s
-    print(board2.fullmove_number)  # +0.15s
-    print(board2.turn)  # +0.32s
-    print(board2.is_fifty_moves())  # +0.04s
-    print(board2.is_check())  # -0.53s
-    print(board.is_legal_move(move))  # -3.49s
-    print(board2.is_legal_move(move2))  # -5.19s
-
-    print(board.is_zeroing(move))  # Pawn move # +0.09s
-    print(board2.is_zeroing(rc.Move.from_uci("e2e3")))  # -1.59 (Likely better because UCI conversion is faster)
-
-    print(board.get_piece_type_on(rc.E2))  # +0.06s
-    print(board.get_color_on(rc.E2))  # +0.21s
-    print(board.get_piece_on(rc.E4))  # -0.05s
-    print(board2.get_piece_on(rc.E2))  # -0.42s
+    print(board2, file=out)  # -10.60s (Not completely comparable (FEN vs grid))
+    print(board2.get_fen(), file=out)  # -14.78s
+    print(board2.halfmove_clock, file=out)  # +0.27s
+    print(board2.fullmove_number, file=out)  # +0.15s
+    print(board2.turn, file=out)  # +0.32s
+    print(board2.is_fifty_moves(), file=out)  # +0.04s
+    print(board2.is_check(), file=out)  # -0.53s
+    print(board.is_legal_move(move), file=out)  # -3.49s
+    print(board2.is_legal_move(move2), file=out)  # -5.19s
+
+    print(board.is_zeroing(move), file=out)  # Pawn move # +0.09s
+    # -1.59 (Likely better because UCI conversion is faster)
+    print(board2.is_zeroing(rc.Move.from_uci("e2e3")), file=out)
+
+    print(board.get_piece_type_on(rc.E2), file=out)  # +0.06s
+    print(board.get_color_on(rc.E2), file=out)  # +0.21s
+    print(board.get_piece_on(rc.E4), file=out)  # -0.05s
+    print(board2.get_piece_on(rc.E2), file=out)  # -0.42s
 
     # The rust-chess board does not currently support popping a move (no history stored)
     board3 = board.make_move_new(move)  # Pawn move # Takes 0.17s
-    print(board3)  # Takes 2.07s
+    print(board3, file=out)  # Takes 2.07s
     move = rc.Move.from_uci("g1f3")  # Horse move
     board.make_move(move, check_legality=True)  # Horse move # -2.81s (including line above)
-    print(board)  # -10.44s (Not completely comparable (FEN vs grid))
+    print(board, file=out)  # -10.44s (Not completely comparable (FEN vs grid))
     # board4 = board2.make_move_new(move2, check_legality=True) # Will panic
     # print(board4)
 
-    print(board.generate_next_move())  # -3.21s
+    print(board.generate_next_move(), file=out)  # -3.21s
     board.reset_move_generator()  # Takes 0.16s
 
     board3 = rc.Board(
         "rnbqkbnr/ppp1pppp/8/3p4/2P1P3/8/PP1P1PPP/RNBQKBNR b KQkq - 0 2",
     )  # Black could capture either pawn # -21.89s
-    print(list(board3.generate_legal_captures()))  # -7.75s
-    print(list(board3.generate_legal_moves()))  # -17.01
+    print(list(board3.generate_legal_captures()), file=out)  # -7.75s
+    print(list(board3.generate_legal_moves()), file=out)  # -17.01
+
+    sys.stdout.write(out.getvalue())
 
 
 def test_chess() -> None:  # noqa: PLR0915
     """Test the python-chess library."""
+    out = io.StringIO()  # Buffer the output and write it once at the end (avoids a flush per print)
+
     color = chess.WHITE
     color2 = chess.COLORS[1]
-    print(color)
-    print(color2)
-    print(not color2)
-    print()
+    print(color, file=out)
+    print(color2, file=out)
+    print(not color2, file=out)
+    print(file=out)
 
     pawn = chess.PAWN
-    print(pawn)
-    print()
+    print(pawn, file=out)
+    print(file=out)
 
     square = chess.Square(12)  # noqa: F841
     square2 = chess.parse_square("e2")
     square3 = chess.A3  # noqa: F841
-    print(square2)
-    print(chess.square_name(square2))
-    print(chess.square_file(square2))
-    print(chess.square_rank(square2))
-    print()
+    print(square2, file=out)
+    print(chess.square_name(square2), file=out)
+    print(chess.square_file(square2), file=out)
+    print(chess.square_rank(square2), file=out)
+    print(file=out)
 
     move = chess.Move(chess.Square(12), chess.Square(28))
     move2 = chess.Move.from_uci("e8d7")  # King move
-    print(move2)
-    print(move2.uci())
-    print(move2.from_square)
-    print(move2.to_square)
-    print(move2.promotion)
-    print()
+    print(move2, file=out)
+    print(move2.uci(), file=out)
+    print(move2.from_square, file=out)
+    print(move2.to_square, file=out)
+    print(move2.promotion, file=out)
+    print(file=out)
 
     board = chess.Board()
     board2 = chess.Board("rnbqkbnr/ppp1p1pp/5p2/3p4/4P3/3P4/PPP1KPPP/RNBQ1BNR b kq - 1 3")
-    print(board2)
-    print(board2.fen())
-    print(board2.halfmove_clock)
-    print(board2.fullmove_number)
-    print(board2.turn)
-    print(board2.is_fifty_moves())
-    print(board2.is_check())
-    print(board.is_legal(move))
-    print(board2.is_legal(move2))
-
-    print(board.is_zeroing(move))  # Pawn move
-    print(board2.is_zeroing(chess.Move.from_uci("e8d7")))  # King move
-
-    print(board.piece_type_at(chess.E2))
-    print(board.color_at(chess.E2))
-    print(board.piece_at(chess.E4))
-    print(board2.piece_at(chess.E2))
+    print(board2, file=out)
+    print(board2.fen(), file=out)
+    print(board2.halfmove_clock, file=out)
+    print(board2.fullmove_number, file=out)
+    print(board2.turn, file=out)
+    print(board2.is_fifty_moves(), file=out)
+    print(board2.is_check(), file=out)
+    print(board.is_legal(move), file=out)
+    print(board2.is_legal(move2), file=out)
+
+    print(board.is_zeroing(move), file=out)  # Pawn move
+    print(board2.is_zeroing(chess.Move.from_uci("e8d7")), file=out)  # King move
+
+    print(board.piece_type_at(chess.E2), file=out)
+    print(board.color_at(chess.E2), file=out)
+    print(board.piece_at(chess.E4), file=out)
+    print(board2.piece_at(chess.E2), file=out)
 
     board.push(move)  # Pawn move
-    print(board)
+    print(board, file=out)
     board.pop()
     board.push(chess.Move.from_uci("g1f3"))  # Horse move
-    print(board)
+    print(board, file=out)
 
-    print(next(iter(board.legal_moves)))
+    print(next(iter(board.legal_moves)), file=out)
 
     board3 = chess.Board(
         "rnbqkbnr/ppp1pppp/8/3p4/2P1P3/8/PP1P1PPP/RNBQKBNR b KQkq - 0 2",
     )  # Black could capture either pawn
-    print(list(board3.generate_legal_captures()))
-    print(list(board3.generate_legal_moves()))
+    print(list(board3.generate_legal_captures()), file=out)
+    print(list(board3.generate_legal_moves()), file=out)
+
+    sys.stdout.write(out.getvalue())
 
 
 if __name__ == "__main__":
-    n = 1
-    n = 100_000
-
-    # time (v0.3.0):
-    # real	0m39.834s
-    # user	0m28.011s
-    # sys	0m11.533s
-    for _ in range(n):
-        # Slower for simple functions and data types, much faster for complex functions
-        test_rust_chess()  # Around 3.5 times faster python-chess :) (for this test)
-
-    print("---------------------------------------")
-
-    # # time:
-    # # real	2m22.639s
-    # # user	2m10.662s
-    # # sys	0m10.804s
-    for _ in range(n):
-        # Biggest slow down is creating with fen, displaying fen, legality, pushing moves, generating moves
-        test_chess()
+    parser = argparse.ArgumentParser(description="Compare the output of rust-chess and python-chess.")
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=1,
+        help="number of runs of each test; output is discarded if more than 1 (default: 1)",
+    )
+    n = parser.parse_args().repeat
+
+    with open(os.devnull, "w") as devnull:  # noqa: PTH123
+        # Repeated runs are for profiling, so drop their output (terminal I/O would dominate the run time)
+        out = devnull if n > 1 else sys.stdout
+
+        # time (v0.3.0):
+        # real	0m39.834s
+        # user	0m28.011s
+        # sys	0m11.533s
+        start = default_timer()
+        with redirect_stdout(out):
+            for _ in range(n):
+                # Slower for simple functions and data types, much faster for complex functions
+                test_rust_chess()  # Around 3.5 times faster python-chess :) (for this test)
+        rust_time = default_timer() - start
+
+        print("---------------------------------------")
+
+        # # time:
+        # # real	2m22.639s
+        # # user	2m10.662s
+        # # sys	0m10.804s
+        start = default_timer()
+        with redirect_stdout(out):
+            for _ in range(n):
+                # Biggest slow down is creating with fen, displaying fen, legality, pushing moves, generating moves
+                test_chess()
+        python_time = default_timer() - start
+
+    if n > 1:
+        print(f"rust-chess:   {n:,} runs in {rust_time:.3f}s")
+        print(f"python-chess: {n:,} runs in {python_time:.3f}s")
@@ -6,6 +6,7 @@ Usage:
 
 import ast
 import doctest
+import re
 import textwrap
 from pathlib import Path
 from types import ModuleType
@@ -26,6 +27,12 @@ IGNORED_DOCTESTS = {
     "BoardBatch.display_color_tiled",
 }
 
+# Shared parser, since it is stateless between calls
+DOCTEST_PARSER = doctest.DocTestParser()
+
+# Markdown fences, TODO lines, and comment lines (stripped before parsing examples)
+FILTERED_LINE_RE = re.compile(r"^[ \t]*(?:```|TODO|#).*\r?\n?", re.MULTILINE)
+
 
 def test_rust_docstrings() -> None:
     """Run the docstring tests on rust-chess using the .pyi stub file."""
@@ -89,14 +96,17 @@ def run_doctest_on_doc(
     runner: doctest.DocTestRunner,
 ) -> None:
     """Run doctest on a single docstring."""
-    # Remove markdown fences and TODO lines
-    lines = doc.splitlines()
-    filtered_lines = [line for line in lines if not line.strip().startswith(("```", "TODO", "#"))]
-    docstring = textwrap.dedent("\n".join(filtered_lines))
+    # Skip docstrings without examples before doing any text processing
+    if ">>>" not in doc:
+        return
+
+    # Remove markdown fences and TODO lines (only if there are any)
+    if "```" in doc or "TODO" in doc or "#" in doc:
+        doc = FILTERED_LINE_RE.sub("", doc)
+    docstring = textwrap.dedent(doc)
 
     # Check if there are examples in the markdown codeblocks
-    parser = doctest.DocTestParser()
-    examples = parser.get_examples(docstring)
+    examples = DOCTEST_PARSER.get_examples(docstring)
     if not examples:
         return
 